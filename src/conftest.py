@@ -0,0 +1,118 @@
+"""
+Shared pytest fixtures for the SummaSaaS Django test suite
+"""
+
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from accounts.models import AccountMembership, CustomerAccount, User
+from billing.models import Plan, Subscription
+
+
+def cleanup_test_data():
+    """
+    Delete all test data with one DELETE per table.
+
+    Subscriptions go first because Plan and CustomerAccount.owner are PROTECTed.
+    """
+    Subscription.objects.filter(account__name__startswith='Test ').delete()
+    AccountMembership.objects.filter(account__name__startswith='Test ').delete()
+    CustomerAccount.objects.filter(name__startswith='Test ').delete()
+    Plan.objects.filter(code__startswith='TEST_').delete()
+    User.objects.filter(username__startswith='test_').delete()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hasher():
+    """
+    Hash test passwords with MD5 instead of the production PBKDF2.
+
+    Any create_user()/set_password() call would otherwise pay for hundreds of
+    thousands of PBKDF2 iterations. Never use this outside tests.
+    """
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def purge_test_data(django_db_setup, django_db_blocker):
+    """
+    Remove test rows committed outside a test transaction.
+
+    Session fixtures write past the per-test rollback, and --reuse-db keeps
+    whatever they leave (or an interrupted run left) for the next session.
+    """
+    with django_db_blocker.unblock():
+        cleanup_test_data()
+    yield
+    with django_db_blocker.unblock():
+        cleanup_test_data()
+
+
+@pytest.fixture(scope="session")
+def seed_test_plans(purge_test_data, django_db_blocker):
+    """
+    Insert the read-only TEST_FREE/TEST_PLUS/TEST_PRO plans once per session.
+
+    TestCase classes look the rows up by code in setUpTestData(), which cannot
+    receive fixtures. Tests that delete a plan, re-insert its code or count
+    its subscriptions must create their own.
+    """
+    with django_db_blocker.unblock():
+        Plan.objects.bulk_create([
+            Plan(
+                code='TEST_FREE',
+                display_name='Test Free Plan',
+                monthly_price_usd=0,
+                char_limit=10000,
+                req_per_hour=10,
+                max_seats=1,
+                max_concurrent_sessions=2,
+                allow_team_members=False,
+                priority_support=False,
+                sla=False
+            ),
+            # Optional fields left at their defaults (DefaultsTests relies on this)
+            Plan(
+                code='TEST_PLUS',
+                display_name='Test Plus',
+                monthly_price_usd=9.99,
+                char_limit=100000,
+                req_per_hour=100,
+                max_seats=1
+            ),
+            Plan(
+                code='TEST_PRO',
+                display_name='Test Pro',
+                monthly_price_usd=29.99,
+                char_limit=1000000,
+                req_per_hour=1000,
+                max_seats=5,
+                allow_team_members=True
+            ),
+        ])
+
+
+@pytest.fixture(scope="session")
+def plan_tiers(django_db_setup, django_db_blocker):
+    """
+    The real FREE/PLUS/PRO/ENTERPRISE plans, seeded once per test session.
+
+    Tests only read these rows, so they are created outside the per-test
+    transaction by the same seed_plans command used in deployments.
+    """
+    with django_db_blocker.unblock():
+        call_command('seed_plans', stdout=io.StringIO())
+        return {plan.code: plan for plan in Plan.objects.filter(code__in=['FREE', 'PLUS', 'PRO', 'ENTERPRISE'])}
+
+
+@pytest.fixture(scope="session")
+def period():
+    """A 30-day billing period starting now, shared by every test in the session"""
+    now = timezone.now()
+    return now, now + timedelta(days=30)
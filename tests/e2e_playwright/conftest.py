@@ -9,7 +9,7 @@ import os
 from typing import Generator
 
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, expect
 
 
 # Test configuration
@@ -20,6 +20,10 @@ VIEWPORT_DESKTOP = {"width": 1920, "height": 1080}
 
 SCREENSHOT_DIR = "project_state/artifacts/playwright"
 
+# Existing account used by authenticated_page (e.g. the seeded test@example.com)
+TEST_USER_EMAIL = os.getenv("TEST_USER_EMAIL")
+TEST_USER_PASSWORD = os.getenv("TEST_USER_PASSWORD")
+
 
 @pytest.fixture(scope="session")
 def browser_type_launch_args(pytestconfig):
@@ -50,44 +54,84 @@ def page(context: BrowserContext) -> Generator[Page, None, None]:
     page.close()
 
 
-@pytest.fixture
-def mobile_page(browser: Browser) -> Generator[Page, None, None]:
-    """Create a mobile viewport page."""
+@pytest.fixture(scope="session")
+def mobile_context(browser: Browser) -> Generator[BrowserContext, None, None]:
+    """Create one mobile browser context for the whole session."""
     context = browser.new_context(
         viewport=VIEWPORT_MOBILE,
         user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X)",
     )
-    page = context.new_page()
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def tablet_context(browser: Browser) -> Generator[BrowserContext, None, None]:
+    """Create one tablet browser context for the whole session."""
+    context = browser.new_context(viewport=VIEWPORT_TABLET)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def mobile_page(mobile_context: BrowserContext) -> Generator[Page, None, None]:
+    """Create a mobile viewport page in the shared mobile context."""
+    page = mobile_context.new_page()
     yield page
     page.close()
-    context.close()
 
 
 @pytest.fixture
-def tablet_page(browser: Browser) -> Generator[Page, None, None]:
-    """Create a tablet viewport page."""
-    context = browser.new_context(viewport=VIEWPORT_TABLET)
-    page = context.new_page()
+def tablet_page(tablet_context: BrowserContext) -> Generator[Page, None, None]:
+    """Create a tablet viewport page in the shared tablet context."""
+    page = tablet_context.new_page()
     yield page
     page.close()
+
+
+@pytest.fixture(scope="session")
+def auth_state(browser: Browser, browser_context_args, tmp_path_factory) -> str:
+    """Log in once through the login form and save the session storage state."""
+    if not (TEST_USER_EMAIL and TEST_USER_PASSWORD):
+        pytest.skip("TEST_USER_EMAIL/TEST_USER_PASSWORD not set")
+
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto(f"{BASE_URL}/accounts/login/")
+    page.fill('input[name="login"]', TEST_USER_EMAIL)
+    page.fill('input[name="password"]', TEST_USER_PASSWORD)
+    with page.expect_navigation():
+        page.click('button[type="submit"]')
+
+    # A rejected login re-renders the form; report its errors instead of timing out
+    errors = page.locator('form [role="alert"], form .text-red-600').all_inner_texts()
+    if errors:
+        context.close()
+        pytest.fail(f"Login as {TEST_USER_EMAIL} failed: {' '.join(errors).strip()}")
+    expect(page).to_have_url(f"{BASE_URL}/dashboard/")
+
+    state = tmp_path_factory.mktemp("auth") / "state.json"
+    context.storage_state(path=str(state))
     context.close()
+    return str(state)
 
 
 @pytest.fixture
-def authenticated_page(page: Page) -> Page:
-    """Create an authenticated session (to be implemented after auth is ready)."""
-    # TODO: Implement after TICKET-02 (authentication)
-    # This will log in a test user and return the authenticated page
-    return page
+def authenticated_page(
+    browser: Browser, browser_context_args, auth_state: str
+) -> Generator[Page, None, None]:
+    """Create a page that reuses the session's logged-in storage state."""
+    context = browser.new_context(**browser_context_args, storage_state=auth_state)
+    page = context.new_page()
+    yield page
+    page.close()
+    context.close()
 
 
 def pytest_configure(config):
-    """Create screenshot directory if it doesn't exist."""
+    """Create the screenshot directory and register test category markers."""
     os.makedirs(SCREENSHOT_DIR, exist_ok=True)
 
-
-# Markers for different test categories
-def pytest_configure(config):
     config.addinivalue_line("markers", "smoke: Smoke tests for critical paths")
     config.addinivalue_line("markers", "visual: Visual regression tests")
     config.addinivalue_line("markers", "accessibility: Accessibility audit tests")
@@ -42,7 +42,12 @@ def test_homepage_responsive(page: Page, viewport: str):
 
     # Navigate and screenshot
     page.goto("http://localhost:8000/")
-    page.screenshot(path=f"project_state/artifacts/playwright/homepage-{viewport}.png")
+    page.screenshot(
+        path=f"project_state/artifacts/playwright/homepage-{viewport}.jpg",
+        type="jpeg",
+        quality=70,
+        full_page=False,
+    )
 
     # Visual assertions (to be implemented)
     # expect(page.locator('.hero-section')).to_be_visible()